@@ -1,21 +1,60 @@
+import base64
+import gzip
+import html
+import http.client
 import json
 import math
 import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from html.parser import HTMLParser
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
+from types import MappingProxyType
 import tkinter as tk
 from tkinter import ttk, messagebox
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import urlopen
+from urllib.parse import SplitResult, unquote, urlencode, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
 from zoneinfo import ZoneInfo
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 STATE_PATH = Path(__file__).resolve().parent / "app_state.txt"
 CONFIG_DIR = Path.home() / ".stoptions_analyzer"
 API_KEY_PATH = CONFIG_DIR / "api_key.txt"
 DATA_DIR = Path(__file__).resolve().parent / "data"
+PERSIST_DELAY_MS = 250
+HORIZON_SNAP_DELAY_MS = 50
+FILTER_DELAY_MS = 100
+FILTER_OPTIONS_CACHE_SIZE = 256
 API_BASE_URL = os.getenv("MASSIVE_BASE_URL", "https://api.polygon.io")
+MAX_IDLE_CONNECTIONS = 4
+REQUEST_HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+MAX_CONDITIONAL_RESPONSES = 64
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+MAX_REDIRECTS = 5
+CACHE_COMPRESSLEVEL = 1
+MARKET_TZ = ZoneInfo("America/New_York")
+EMPTY_MAPPING = MappingProxyType({})
+_CACHE_LOCKS: dict[str, threading.Lock] = {}
+_CACHE_LOCKS_GUARD = threading.Lock()
+_MARKET_CACHE: dict[Path, tuple[int, int, dict | None]] = {}
+_MARKET_CACHE_LOCK = threading.Lock()
+RISK_FREE_RATE = 0.04
+BLACK_SCHOLES_GREEKS = ("delta", "gamma", "theta", "vega", "rho")
+SQRT_2 = math.sqrt(2.0)
+SQRT_2PI = math.sqrt(2.0 * math.pi)
 HORIZON_CONFIGS = [
     ("Day", 1, 10, "10m"),
     ("3 Day", 3, 30, "30m"),
@@ -28,6 +67,52 @@ HORIZON_CONFIGS = [
     ("5Y", 1825, 7200, "5d"),
     ("10Y", 3650, 10080, "7d"),
 ]
+MAIN_MENU_PAGES = (
+    ("Enter Stock Tickers", "TickerEntryPage"),
+    ("Select Stock", "TickerSelectPage"),
+    ("Analysis", "AnalysisPage"),
+)
+ANALYSIS_MODES = ("Stock Analysis", "Option Analysis")
+OPTION_STRATEGIES = ("Naked Call", "Naked Put", "Vertical Spread", "Calendar Spread")
+STOCK_INFO_FIELDS = (
+    ("Price", "price"),
+    ("Previous Close", "prev_close"),
+    ("Open", "open"),
+    ("High", "high"),
+    ("Low", "low"),
+    ("Volume", "volume"),
+    ("Market Cap", "market_cap"),
+    ("52 Week Range", "range_52w"),
+)
+STOCK_VALUE_SOURCES = (
+    ("price", "close"),
+    ("prev_close", "close"),
+    ("open", "open"),
+    ("high", "high"),
+    ("low", "low"),
+    ("volume", "volume"),
+    ("market_cap", None),
+    ("range_52w", None),
+)
+OPTION_INFO_FIELDS = (
+    ("Contract", "contract"),
+    ("Expiration", "expiration"),
+    ("Type", "type"),
+    ("Strike", "strike"),
+)
+GREEK_FIELDS = (
+    ("Delta", "delta"),
+    ("Gamma", "gamma"),
+    ("Theta", "theta"),
+    ("Vega", "vega"),
+    ("Rho", "rho"),
+    ("IV", "iv"),
+)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+UNSAFE_TICKER_CHARS_RE = re.compile(r"[\W_]")
+TITLE_FONT = ("Arial", 24, "bold")
+HEADER_FONT = ("Arial", 18, "bold")
+SECTION_FONT = ("Arial", 12, "bold")
 
 
 def load_api_key() -> str:
@@ -48,41 +133,165 @@ def save_api_key(key: str) -> None:
         pass
 
 
+def _first_non_none(*values: object) -> object:
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
+def _encode_json(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_json(data: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def _effective_market_date_for_minute(_minute: int) -> date:
+    now = datetime.now(MARKET_TZ)
+    market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
+    if now < market_open:
+        return (now - timedelta(days=1)).date()
+    return now.date()
+
+
+def effective_market_date() -> date:
+    return _effective_market_date_for_minute(int(time.time() // 60))
+
+
+@lru_cache(maxsize=64)
+def normalize_contract_type(value: str | None) -> str | None:
+    if not value:
+        return None
+    return str(value).strip().upper()
+
+
+@lru_cache(maxsize=4096)
+def format_strike(value: float | int | str | None) -> str | None:
+    if value is None:
+        return None
+    if type(value) is int:
+        return str(value)
+    try:
+        numeric = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    if numeric.is_integer():
+        return str(int(numeric))
+    return f"{numeric:.2f}".rstrip("0").rstrip(".")
+
+
+def sort_strikes(strikes: Iterable[str]) -> list[str]:
+    keyed: list[tuple[int, float, str]] = []
+    for strike in strikes:
+        try:
+            keyed.append((0, float(strike), strike))
+        except ValueError:
+            keyed.append((1, 0.0, strike))
+    keyed.sort()
+    return [strike for _rank, _numeric, strike in keyed]
+
+
 def _safe_ticker_name(ticker: str) -> str:
-    return "".join(char if char.isalnum() else "_" for char in ticker.upper())
+    return UNSAFE_TICKER_CHARS_RE.sub("_", ticker.upper())
 
 
 def _cache_path(ticker: str) -> Path:
+    return DATA_DIR / f"{_safe_ticker_name(ticker)}.json.gz"
+
+
+def _legacy_cache_path(ticker: str) -> Path:
     return DATA_DIR / f"{_safe_ticker_name(ticker)}.json"
 
 
-def load_cached_market_data(ticker: str) -> dict | None:
-    path = _cache_path(ticker)
-    if not path.exists():
-        return None
+def _read_market_cache(path: Path, stat: os.stat_result) -> dict | None:
+    with _MARKET_CACHE_LOCK:
+        memo = _MARKET_CACHE.get(path)
+    if memo is not None and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+        return memo[2]
     try:
-        return json.loads(path.read_text())
-    except json.JSONDecodeError:
-        return None
+        data = path.read_bytes()
+        if path.suffix == ".gz":
+            data = gzip.decompress(data)
+        payload = _decode_json(data)
+    except (OSError, EOFError, zlib.error, json.JSONDecodeError):
+        payload = None
+    if not isinstance(payload, dict):
+        payload = None
+    _remember_market_cache(path, stat, payload)
+    return payload
+
+
+def _remember_market_cache(path: Path, stat: os.stat_result, payload: dict | None) -> None:
+    with _MARKET_CACHE_LOCK:
+        _MARKET_CACHE[path] = (stat.st_mtime_ns, stat.st_size, payload)
+
+
+def load_cached_market_data(ticker: str) -> dict | None:
+    for path in (_cache_path(ticker), _legacy_cache_path(ticker)):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        except OSError:
+            return None
+        return _read_market_cache(path, stat)
+    return None
 
 
 def save_cached_market_data(ticker: str, payload: dict) -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     path = _cache_path(ticker)
-    path.write_text(json.dumps(payload, indent=2))
+    blob = gzip.compress(_encode_json(payload), compresslevel=CACHE_COMPRESSLEVEL)
+    with tempfile.NamedTemporaryFile(
+        dir=DATA_DIR, prefix=f"{path.name}.", suffix=".tmp", delete=False
+    ) as handle:
+        temp_path = Path(handle.name)
+    try:
+        temp_path.write_bytes(blob)
+        os.replace(temp_path, path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+    _remember_market_cache(path, path.stat(), payload)
+    legacy_path = _legacy_cache_path(ticker)
+    legacy_path.unlink(missing_ok=True)
+    with _MARKET_CACHE_LOCK:
+        _MARKET_CACHE.pop(legacy_path, None)
+
+
+def _cache_lock(ticker: str) -> threading.Lock:
+    with _CACHE_LOCKS_GUARD:
+        return _CACHE_LOCKS.setdefault(_safe_ticker_name(ticker), threading.Lock())
+
+
+def update_cached_market_data(ticker: str, update: Callable[[dict], dict]) -> dict:
+    with _cache_lock(ticker):
+        payload = update(load_cached_market_data(ticker) or {})
+        save_cached_market_data(ticker, payload)
+    return payload
 
 
 class MassiveApiClient:
     def __init__(self, api_key: str, base_url: str = API_BASE_URL) -> None:
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
+        self._idle_connections: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._pool_lock = threading.Lock()
+        self._conditional_responses: dict[str, tuple[str | None, str | None, dict]] = {}
+        self._conditional_lock = threading.Lock()
+        self._proxies = getproxies()
 
     def _request(self, path: str, params: dict[str, str]) -> dict:
         params = {**params, "apiKey": self.api_key}
         url = f"{self.base_url}{path}?{urlencode(params)}"
-        with urlopen(url, timeout=10) as response:
-            payload = response.read().decode("utf-8")
-        return json.loads(payload)
+        return self._request_url(url)
 
     def fetch_previous_close(self, ticker: str) -> dict:
         data = self._request(f"/v2/aggs/ticker/{ticker}/prev", {"adjusted": "true"})
@@ -95,84 +304,205 @@ class MassiveApiClient:
             "volume": result.get("v"),
         }
 
+    def _proxy_for(self, scheme: str, netloc: str) -> SplitResult | None:
+        proxy = self._proxies.get(scheme)
+        if not proxy or proxy_bypass(netloc):
+            return None
+        return urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+    def _proxy_headers(self, proxy: SplitResult) -> dict[str, str]:
+        if proxy.username is None:
+            return {}
+        credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+        token = base64.b64encode(credentials.encode()).decode("ascii")
+        return {"Proxy-Authorization": f"Basic {token}"}
+
+    def _acquire_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        with self._pool_lock:
+            idle = self._idle_connections.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        proxy = self._proxy_for(scheme, netloc)
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(netloc, timeout=10)
+            return http.client.HTTPConnection(netloc, timeout=10)
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(proxy.hostname, proxy.port, timeout=10)
+            connection.set_tunnel(netloc, headers=self._proxy_headers(proxy))
+            return connection
+        return http.client.HTTPConnection(proxy.hostname, proxy.port, timeout=10)
+
+    def _release_connection(
+        self, scheme: str, netloc: str, connection: http.client.HTTPConnection
+    ) -> None:
+        with self._pool_lock:
+            idle = self._idle_connections.setdefault((scheme, netloc), [])
+            if len(idle) < MAX_IDLE_CONNECTIONS:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _send(
+        self, connection: http.client.HTTPConnection, target: str, headers: dict[str, str]
+    ) -> http.client.HTTPResponse:
+        connection.request("GET", target, headers=headers)
+        return connection.getresponse()
+
+    def _conditional_headers(self, url: str) -> tuple[dict[str, str], dict | None]:
+        with self._conditional_lock:
+            cached = self._conditional_responses.get(url)
+        if cached is None:
+            return REQUEST_HEADERS, None
+        etag, last_modified, data = cached
+        headers = dict(REQUEST_HEADERS)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers, data
+
+    def _remember_response(
+        self, url: str, response: http.client.HTTPResponse, data: object
+    ) -> None:
+        etag = response.getheader("ETag")
+        last_modified = response.getheader("Last-Modified")
+        if not (etag or last_modified) or not isinstance(data, dict):
+            return
+        with self._conditional_lock:
+            responses = self._conditional_responses
+            responses.pop(url, None)
+            if len(responses) >= MAX_CONDITIONAL_RESPONSES:
+                del responses[next(iter(responses))]
+            responses[url] = (etag, last_modified, data)
+
+    def _exchange(
+        self, url: str, headers: dict[str, str]
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        if parts.scheme == "http":
+            proxy = self._proxy_for(parts.scheme, parts.netloc)
+            if proxy is not None:
+                target = f"http://{parts.netloc}{target}"
+                headers = {**headers, **self._proxy_headers(proxy)}
+        connection = self._acquire_connection(parts.scheme, parts.netloc)
+        reused = connection.sock is not None
+        try:
+            try:
+                response = self._send(connection, target, headers)
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if not reused:
+                    raise
+                response = self._send(connection, target, headers)
+            body = response.read()
+            if response.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+        except (http.client.HTTPException, OSError, EOFError, zlib.error) as exc:
+            connection.close()
+            raise URLError(exc) from exc
+        self._release_connection(parts.scheme, parts.netloc, connection)
+        return response, body
+
     def _request_url(self, url: str) -> dict:
-        with urlopen(url, timeout=10) as response:
-            payload = response.read().decode("utf-8")
-        return json.loads(payload)
+        headers, cached = self._conditional_headers(url)
+        location = url
+        for _hop in range(MAX_REDIRECTS + 1):
+            response, body = self._exchange(location, headers)
+            redirect = response.getheader("Location")
+            if response.status not in REDIRECT_STATUSES or not redirect:
+                break
+            location = urljoin(location, redirect)
+        else:
+            raise URLError(f"Too many redirects for {urlsplit(url).netloc}")
+        if response.status == 304 and cached is not None:
+            return cached
+        if not 200 <= response.status < 300:
+            raise HTTPError(location, response.status, response.reason, response.headers, BytesIO(body))
+        try:
+            data = _decode_json(body)
+        except ValueError as exc:
+            raise URLError(f"Invalid JSON response from {urlsplit(location).netloc}") from exc
+        self._remember_response(url, response, data)
+        return data
+
+    def _with_api_key(self, url: str) -> str:
+        if "apiKey=" in url:
+            return url
+        joiner = "&" if "?" in url else "?"
+        return f"{url}{joiner}apiKey={self.api_key}"
+
+    def _paged_results(self, path: str, params: dict[str, str]) -> Iterator[list[dict]]:
+        data = self._request(path, params)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                next_url = data.get("next_url")
+                pending = (
+                    executor.submit(self._request_url, self._with_api_key(next_url))
+                    if next_url
+                    else None
+                )
+                yield data.get("results", [])
+                if pending is None:
+                    return
+                data = pending.result()
 
     def fetch_option_contracts(self, ticker: str, limit: int = 1000) -> list[dict]:
         results: list[dict] = []
         params = {"underlying_ticker": ticker, "limit": str(limit)}
-        data = self._request("/v3/reference/options/contracts", params)
-        results.extend(data.get("results", []))
-        next_url = data.get("next_url")
-        while next_url:
-            if "apiKey=" not in next_url:
-                joiner = "&" if "?" in next_url else "?"
-                next_url = f"{next_url}{joiner}apiKey={self.api_key}"
-            data = self._request_url(next_url)
-            results.extend(data.get("results", []))
-            next_url = data.get("next_url")
+        for page in self._paged_results("/v3/reference/options/contracts", params):
+            results.extend(page)
         return results
 
     def fetch_option_snapshots(self, ticker: str, limit: int = 250) -> list[dict]:
         results: list[dict] = []
         params = {"limit": str(limit)}
-        data = self._request(f"/v3/snapshot/options/{ticker}", params)
-        results.extend(self._normalize_option_snapshots(data.get("results", [])))
-        next_url = data.get("next_url")
-        while next_url:
-            if "apiKey=" not in next_url:
-                joiner = "&" if "?" in next_url else "?"
-                next_url = f"{next_url}{joiner}apiKey={self.api_key}"
-            data = self._request_url(next_url)
-            results.extend(self._normalize_option_snapshots(data.get("results", [])))
-            next_url = data.get("next_url")
+        for page in self._paged_results(f"/v3/snapshot/options/{ticker}", params):
+            results.extend(self._normalize_option_snapshots(page))
         return results
 
     def _normalize_option_snapshots(self, snapshots: list[dict]) -> list[dict]:
         normalized: list[dict] = []
+        append = normalized.append
         for snapshot in snapshots:
-            details = snapshot.get("details", {}) or {}
-            greeks = snapshot.get("greeks", {}) or {}
-            day = snapshot.get("day", {}) or {}
-            last_trade = snapshot.get("last_trade", {}) or {}
-            last_quote = snapshot.get("last_quote", {}) or {}
-            implied_vol = snapshot.get("implied_volatility")
+            get = snapshot.get
+            details = (get("details") or EMPTY_MAPPING).get
+            greeks = get("greeks") or {}
+            day = (get("day") or EMPTY_MAPPING).get
+            last_trade = (get("last_trade") or EMPTY_MAPPING).get
+            last_quote = (get("last_quote") or EMPTY_MAPPING).get
+            implied_vol = get("implied_volatility")
             if implied_vol is not None and "iv" not in greeks:
                 greeks = {**greeks, "iv": implied_vol}
-            volume = snapshot.get("volume")
-            if volume is None:
-                volume = day.get("volume") or day.get("v")
-            open_interest = snapshot.get("open_interest")
-            if open_interest is None:
-                open_interest = details.get("open_interest")
-            normalized.append(
+            append(
                 {
-                    "ticker": details.get("ticker") or snapshot.get("ticker"),
-                    "expiration_date": details.get("expiration_date"),
-                    "contract_type": details.get("contract_type"),
-                    "strike_price": details.get("strike_price"),
+                    "ticker": _first_non_none(details("ticker"), get("ticker")),
+                    "expiration_date": details("expiration_date"),
+                    "contract_type": details("contract_type"),
+                    "strike_price": details("strike_price"),
                     "greeks": greeks,
                     "implied_volatility": implied_vol,
-                    "volume": volume,
-                    "open_interest": open_interest,
-                    "bid": last_quote.get("bid")
-                    or last_quote.get("bid_price")
-                    or last_quote.get("bp"),
-                    "ask": last_quote.get("ask")
-                    or last_quote.get("ask_price")
-                    or last_quote.get("ap"),
-                    "last": last_trade.get("price") or last_trade.get("p"),
+                    "volume": _first_non_none(get("volume"), day("volume"), day("v")),
+                    "open_interest": _first_non_none(
+                        get("open_interest"), details("open_interest")
+                    ),
+                    "bid": _first_non_none(
+                        last_quote("bid"), last_quote("bid_price"), last_quote("bp")
+                    ),
+                    "ask": _first_non_none(
+                        last_quote("ask"), last_quote("ask_price"), last_quote("ap")
+                    ),
+                    "last": _first_non_none(last_trade("price"), last_trade("p")),
                 }
             )
         return normalized
 
     def fetch_aggregates(self, ticker: str, days_back: int, minutes_per_bar: int) -> list[dict]:
         if days_back == 1:
-            now = datetime.now(ZoneInfo("America/New_York"))
-            market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-            end_date = (now - timedelta(days=1)).date() if now < market_open else now.date()
+            end_date = effective_market_date()
             start_date = end_date
         else:
             end_date = date.today()
@@ -184,69 +514,316 @@ class MassiveApiClient:
         return data.get("results", [])
 
 
-@dataclass
+class MarketDataError(Exception):
+    def __init__(self, error: URLError, hint: str) -> None:
+        super().__init__(str(error))
+        self.error = error
+        self.hint = hint
+
+
+def _fetch_with_hint(hint: str, fetch: Callable[..., object], *args: object) -> object:
+    try:
+        return fetch(*args)
+    except URLError as exc:
+        raise MarketDataError(exc, hint) from exc
+
+
+@dataclass(slots=True)
+class OptionChain:
+    records: list[dict] = field(default_factory=list)
+    expirations: list[str | None] = field(default_factory=list)
+    strikes: list[str | None] = field(default_factory=list)
+    types: list[str | None] = field(default_factory=list)
+    labels: list[str] = field(default_factory=list)
+    rows_by_expiration: dict[str, list[int]] = field(default_factory=dict)
+    rows_by_strike: dict[str, list[int]] = field(default_factory=dict)
+    rows_by_type: dict[str, list[int]] = field(default_factory=dict)
+    strike_order: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "OptionChain":
+        expirations = [record.get("expiration_date") for record in records]
+        strikes = [format_strike(record.get("strike_price")) for record in records]
+        types = [normalize_contract_type(record.get("contract_type")) for record in records]
+        labels = [
+            f"{record.get('ticker', '--')} {record.get('expiration_date', '--')} "
+            f"{contract_type or '--'} {record.get('strike_price', '--')}"
+            for record, contract_type in zip(records, types)
+        ]
+        rows_by_strike = _rows_by_value(strikes)
+        return cls(
+            records=records,
+            expirations=expirations,
+            strikes=strikes,
+            types=types,
+            labels=labels,
+            rows_by_expiration=_rows_by_value(expirations),
+            rows_by_strike=rows_by_strike,
+            rows_by_type=_rows_by_value(types),
+            strike_order={
+                strike: rank for rank, strike in enumerate(sort_strikes(rows_by_strike))
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def matching_rows(
+        self, expiration: str | None, strike: str | None, contract_type: str | None
+    ) -> list[int]:
+        columns = [
+            rows_by_value.get(value, ())
+            for rows_by_value, value in (
+                (self.rows_by_expiration, expiration),
+                (self.rows_by_strike, strike),
+                (self.rows_by_type, contract_type),
+            )
+            if value
+        ]
+        if not columns:
+            return list(range(len(self.records)))
+        if len(columns) == 1:
+            return list(columns[0])
+        columns.sort(key=len)
+        selected = set(columns[0]).intersection(*columns[1:])
+        return sorted(selected)
+
+    def values_matching(
+        self,
+        column: list[str | None],
+        rows_by_value: dict[str, list[int]],
+        expiration: str | None,
+        strike: str | None,
+        contract_type: str | None,
+    ) -> Iterable[str]:
+        if not (expiration or strike or contract_type):
+            return rows_by_value.keys()
+        rows = self.matching_rows(expiration, strike, contract_type)
+        return {value for value in map(column.__getitem__, rows) if value}
+
+
+def _rows_by_value(column: list[str | None]) -> dict[str, list[int]]:
+    rows_by_value: dict[str, list[int]] = {}
+    for row, value in enumerate(column):
+        if value:
+            rows_by_value.setdefault(value, []).append(row)
+    return rows_by_value
+
+
+def _normal_cdf(value: float) -> float:
+    return 0.5 * (1.0 + math.erf(value / SQRT_2))
+
+
+def _normal_pdf(value: float) -> float:
+    return math.exp(-0.5 * value * value) / SQRT_2PI
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def black_scholes_greeks(
+    spot: float, strike: float, years: float, rate: float, sigma: float, is_call: bool
+) -> dict[str, float]:
+    sqrt_years = math.sqrt(years)
+    d1 = (math.log(spot / strike) + (rate + 0.5 * sigma * sigma) * years) / (sigma * sqrt_years)
+    d2 = d1 - sigma * sqrt_years
+    pdf_d1 = _normal_pdf(d1)
+    discount = strike * math.exp(-rate * years)
+    decay = -spot * pdf_d1 * sigma / (2.0 * sqrt_years)
+    if is_call:
+        cdf_d2 = _normal_cdf(d2)
+        delta = _normal_cdf(d1)
+        theta = decay - rate * discount * cdf_d2
+        rho = years * discount * cdf_d2
+    else:
+        cdf_d2 = _normal_cdf(-d2)
+        delta = _normal_cdf(d1) - 1.0
+        theta = decay + rate * discount * cdf_d2
+        rho = -years * discount * cdf_d2
+    return {
+        "delta": delta,
+        "gamma": pdf_d1 / (spot * sigma * sqrt_years),
+        "theta": theta / 365.0,
+        "vega": spot * pdf_d1 * sqrt_years / 100.0,
+        "rho": rho / 100.0,
+    }
+
+
+def estimate_missing_greeks(
+    records: list[dict], spot: object, as_of: date, rate: float = RISK_FREE_RATE
+) -> dict[str, dict[str, float]]:
+    estimates: dict[str, dict[str, float]] = {}
+    try:
+        spot_price = float(spot)
+    except (TypeError, ValueError):
+        return estimates
+    if spot_price <= 0:
+        return estimates
+    for record in records:
+        ticker = record.get("ticker")
+        greeks = record.get("greeks")
+        if ticker is None:
+            continue
+        if not isinstance(greeks, dict):
+            continue
+        if all(greeks.get(name) is not None for name in BLACK_SCHOLES_GREEKS):
+            continue
+        contract_type = normalize_contract_type(record.get("contract_type"))
+        if contract_type not in ("CALL", "PUT"):
+            continue
+        try:
+            sigma = float(greeks.get("iv"))
+            strike = float(record.get("strike_price"))
+            years = (_parse_iso_date(record.get("expiration_date")) - as_of).days / 365.0
+        except (TypeError, ValueError):
+            continue
+        if sigma <= 0 or strike <= 0 or years <= 0:
+            continue
+        computed = black_scholes_greeks(
+            spot_price, strike, years, rate, sigma, contract_type == "CALL"
+        )
+        estimates[ticker] = {
+            name: value for name, value in computed.items() if greeks.get(name) is None
+        }
+    return estimates
+
+
+def aggregate_series(aggregates: list[dict] | dict) -> dict[str, list]:
+    if isinstance(aggregates, dict):
+        return aggregates
+    closes: list[float] = []
+    timestamps: list[int] = []
+    for item in aggregates:
+        try:
+            close_value = float(item.get("c"))
+            timestamp = int(item.get("t"))
+        except (TypeError, ValueError):
+            continue
+        closes.append(close_value)
+        timestamps.append(timestamp)
+    return {"c": closes, "t": timestamps}
+
+
+def _map_chart_points(
+    closes: list[float],
+    left: float,
+    top: float,
+    right: float,
+    bottom: float,
+    min_price: float,
+    price_span: float,
+) -> list[float]:
+    total_points = len(closes)
+    x_scale = (right - left) / max(total_points - 1, 1)
+    y_scale = (bottom - top) / price_span
+    points = [0.0] * (2 * total_points)
+    points[0::2] = [left + x_scale * idx for idx in range(total_points)]
+    points[1::2] = [bottom - y_scale * (price - min_price) for price in closes]
+    return points
+
+
+STATE_FIELDS = ("tickers", "selected_ticker", "analysis_mode", "option_strategy")
+
+
+@dataclass(slots=True)
 class AppState:
     tickers: list[str] = field(default_factory=list)
     selected_ticker: str | None = None
     analysis_mode: str = "Stock Analysis"
     option_strategy: str = "Naked Call"
+    _last_blob: bytes = field(default=b"", init=False, compare=False, repr=False)
+
+    def _serialize(self) -> bytes:
+        return _encode_json({key: getattr(self, key) for key in STATE_FIELDS})
 
     def save(self) -> None:
-        payload = {
-            "tickers": self.tickers,
-            "selected_ticker": self.selected_ticker,
-            "analysis_mode": self.analysis_mode,
-            "option_strategy": self.option_strategy,
-        }
-        STATE_PATH.write_text(json.dumps(payload, indent=2))
+        blob = self._serialize()
+        if blob == self._last_blob:
+            return
+        temp_path = STATE_PATH.with_suffix(STATE_PATH.suffix + ".tmp")
+        temp_path.write_bytes(blob)
+        os.replace(temp_path, STATE_PATH)
+        self._last_blob = blob
 
     @classmethod
     def load(cls) -> "AppState":
-        if not STATE_PATH.exists():
-            return cls()
         try:
-            payload = json.loads(STATE_PATH.read_text())
+            payload = _decode_json(STATE_PATH.read_bytes())
+        except FileNotFoundError:
+            return cls()
         except json.JSONDecodeError:
             return cls()
-        return cls(
-            tickers=payload.get("tickers", []),
-            selected_ticker=payload.get("selected_ticker"),
-            analysis_mode=payload.get("analysis_mode", payload.get("analysis_type", "Stock Analysis")),
-            option_strategy=payload.get("option_strategy", "Naked Call"),
-        )
+        if "analysis_mode" not in payload and "analysis_type" in payload:
+            payload["analysis_mode"] = payload["analysis_type"]
+        values = {key: payload[key] for key in STATE_FIELDS if key in payload}
+        state = cls(**values)
+        state._last_blob = state._serialize()
+        return state
 
 
 class StoptionsApp(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
         self.title("Stoptions Analyzer")
+        style = ttk.Style(self)
+        style.configure("Title.TLabel", font=TITLE_FONT)
+        style.configure("Header.TLabel", font=HEADER_FONT)
+        style.configure("Section.TLabel", font=SECTION_FONT)
         self.geometry("1200x800")
         self._maximize_window()
         self.state = AppState.load()
         self.api_key = load_api_key()
+        self._persist_job: str | None = None
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         container = ttk.Frame(self)
         container.pack(fill="both", expand=True)
         container.columnconfigure(0, weight=1)
         container.rowconfigure(0, weight=1)
 
+        self._container = container
+        self._frame_classes: dict[str, type[ttk.Frame]] = {
+            frame_cls.__name__: frame_cls
+            for frame_cls in (MainMenu, TickerEntryPage, TickerSelectPage, AnalysisPage)
+        }
         self.frames: dict[str, ttk.Frame] = {}
-        for frame_cls in (MainMenu, TickerEntryPage, TickerSelectPage, AnalysisPage):
-            frame = frame_cls(container, self)
-            self.frames[frame_cls.__name__] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
+        self._build_frame("MainMenu")
 
         self.show_frame("MainMenu")
 
+    def _build_frame(self, name: str) -> ttk.Frame:
+        frame = self._frame_classes[name](self._container, self)
+        frame.grid(row=0, column=0, sticky="nsew")
+        self.frames[name] = frame
+        return frame
+
     def show_frame(self, name: str) -> None:
-        frame = self.frames[name]
+        frame = self.frames[name] if name in self.frames else self._build_frame(name)
         if hasattr(frame, "refresh"):
             frame.refresh()
         frame.tkraise()
 
     def persist_state(self) -> None:
+        if self._persist_job is not None:
+            self.after_cancel(self._persist_job)
+        self._persist_job = self.after(PERSIST_DELAY_MS, self._flush_state)
+
+    def _flush_state(self) -> None:
+        self._persist_job = None
         self.state.save()
 
+    def _on_close(self) -> None:
+        try:
+            if self._persist_job is not None:
+                self.after_cancel(self._persist_job)
+                self._flush_state()
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.destroy()
+
     def _maximize_window(self) -> None:
         self.update_idletasks()
         try:
@@ -260,7 +837,7 @@ class MainMenu(ttk.Frame):
         super().__init__(parent)
         self.controller = controller
 
-        title = ttk.Label(self, text="Stoptions Analyzer", font=("Arial", 24, "bold"))
+        title = ttk.Label(self, text="Stoptions Analyzer", style="Title.TLabel")
         title.pack(pady=20)
 
         description = ttk.Label(
@@ -286,26 +863,13 @@ class MainMenu(ttk.Frame):
         button_frame = ttk.Frame(self)
         button_frame.pack(pady=40)
 
-        ttk.Button(
-            button_frame,
-            text="Enter Stock Tickers",
-            command=lambda: controller.show_frame("TickerEntryPage"),
-            width=30,
-        ).grid(row=0, column=0, pady=10)
-
-        ttk.Button(
-            button_frame,
-            text="Select Stock",
-            command=lambda: controller.show_frame("TickerSelectPage"),
-            width=30,
-        ).grid(row=1, column=0, pady=10)
-
-        ttk.Button(
-            button_frame,
-            text="Analysis",
-            command=lambda: controller.show_frame("AnalysisPage"),
-            width=30,
-        ).grid(row=2, column=0, pady=10)
+        for row, (text, page) in enumerate(MAIN_MENU_PAGES):
+            ttk.Button(
+                button_frame,
+                text=text,
+                command=lambda page=page: controller.show_frame(page),
+                width=30,
+            ).grid(row=row, column=0, pady=10)
 
     def refresh(self) -> None:
         self.api_key_var.set(self.controller.api_key)
@@ -329,7 +893,7 @@ class TickerEntryPage(ttk.Frame):
         super().__init__(parent)
         self.controller = controller
 
-        ttk.Label(self, text="Enter Stock Tickers", font=("Arial", 18, "bold")).pack(pady=10)
+        ttk.Label(self, text="Enter Stock Tickers", style="Header.TLabel").pack(pady=10)
 
         instructions = ttk.Label(
             self,
@@ -339,6 +903,7 @@ class TickerEntryPage(ttk.Frame):
 
         self.text_box = tk.Text(self, height=18, width=40)
         self.text_box.pack(pady=10)
+        self._last_text: str | None = None
 
         button_row = ttk.Frame(self)
         button_row.pack(pady=10)
@@ -351,12 +916,23 @@ class TickerEntryPage(ttk.Frame):
         ).grid(row=0, column=1, padx=10)
 
     def refresh(self) -> None:
+        text = "\n".join(self.controller.state.tickers)
+        if text == self._last_text and not self.text_box.edit_modified():
+            return
         self.text_box.delete("1.0", tk.END)
-        self.text_box.insert("1.0", "\n".join(self.controller.state.tickers))
+        self.text_box.insert("1.0", text)
+        self.text_box.edit_modified(False)
+        self._last_text = text
 
     def save_tickers(self) -> None:
         raw = self.text_box.get("1.0", tk.END)
-        tickers = [line.strip().upper() for line in raw.splitlines() if line.strip()]
+        tickers: list[str] = []
+        seen: set[str] = set()
+        for line in raw.splitlines():
+            ticker = line.strip().upper()
+            if ticker and ticker not in seen:
+                seen.add(ticker)
+                tickers.append(ticker)
         if not tickers:
             messagebox.showinfo("No tickers", "Please enter at least one ticker.")
             return
@@ -372,7 +948,7 @@ class TickerSelectPage(ttk.Frame):
         super().__init__(parent)
         self.controller = controller
 
-        ttk.Label(self, text="Select a Stock", font=("Arial", 18, "bold")).pack(pady=10)
+        ttk.Label(self, text="Select a Stock", style="Header.TLabel").pack(pady=10)
 
         list_frame = ttk.Frame(self)
         list_frame.pack(pady=10, fill="both", expand=True)
@@ -399,13 +975,19 @@ class TickerSelectPage(ttk.Frame):
         ).grid(row=0, column=1, padx=10)
 
     def refresh(self) -> None:
+        tickers = self.controller.state.tickers
+        selected = self.controller.state.selected_ticker
         self.ticker_list.delete(0, tk.END)
-        for ticker in self.controller.state.tickers:
-            self.ticker_list.insert(tk.END, ticker)
-        if self.controller.state.selected_ticker in self.controller.state.tickers:
-            index = self.controller.state.tickers.index(self.controller.state.selected_ticker)
-            self.ticker_list.selection_set(index)
-            self.ticker_list.see(index)
+        if tickers:
+            self.ticker_list.insert(tk.END, *tickers)
+        if selected is None:
+            return
+        try:
+            index = tickers.index(selected)
+        except ValueError:
+            return
+        self.ticker_list.selection_set(index)
+        self.ticker_list.see(index)
 
     def use_selected(self) -> None:
         selection = self.ticker_list.curselection()
@@ -423,7 +1005,12 @@ class AnalysisPage(ttk.Frame):
         super().__init__(parent)
         self.controller = controller
         self.api_client: MassiveApiClient | None = None
+        self._load_generation = 0
+        self._pending_fetches: dict[tuple[str, str, int], Future] = {}
+        self._label_states: dict[ttk.Label, tuple[str, str]] = {}
+        self._error_dialog: tuple[tk.Toplevel, tk.Text] | None = None
         self.option_contract: dict | None = None
+        self.estimated_greeks: dict[str, dict[str, float]] = {}
         self.scroll_canvas = tk.Canvas(self, highlightthickness=0)
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.scroll_canvas.yview)
         self.scroll_canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -444,7 +1031,7 @@ class AnalysisPage(ttk.Frame):
         chart_header = ttk.Label(
             stock_frame,
             text="Current (or previous trading day) chart",
-            font=("Arial", 12, "bold"),
+            style="Section.TLabel",
         )
         chart_header.pack(pady=(10, 5))
 
@@ -459,6 +1046,7 @@ class AnalysisPage(ttk.Frame):
             text="Daily chart preview will render here.",
             fill="#666",
         )
+        self._chart_key: tuple | None = None
 
         slider_frame = ttk.Frame(stock_frame)
         slider_frame.pack(fill="x", padx=20, pady=(5, 10))
@@ -467,6 +1055,8 @@ class AnalysisPage(ttk.Frame):
             row=0, column=0, columnspan=len(HORIZON_CONFIGS), sticky="w"
         )
         self.horizon_var = tk.IntVar(value=0)
+        self._horizon_job: str | None = None
+        self._pending_horizon = "0"
         self.horizon_slider = tk.Scale(
             slider_frame,
             from_=0,
@@ -497,16 +1087,7 @@ class AnalysisPage(ttk.Frame):
         self.stock_values: dict[str, ttk.Label] = {}
         self._build_info_grid(
             self.stock_info_frame,
-            [
-                ("Price", "price"),
-                ("Previous Close", "prev_close"),
-                ("Open", "open"),
-                ("High", "high"),
-                ("Low", "low"),
-                ("Volume", "volume"),
-                ("Market Cap", "market_cap"),
-                ("52 Week Range", "range_52w"),
-            ],
+            STOCK_INFO_FIELDS,
             self.stock_values,
             columns=4,
         )
@@ -516,12 +1097,7 @@ class AnalysisPage(ttk.Frame):
         self.option_values: dict[str, ttk.Label] = {}
         self._build_info_grid(
             self.option_info_frame,
-            [
-                ("Contract", "contract"),
-                ("Expiration", "expiration"),
-                ("Type", "type"),
-                ("Strike", "strike"),
-            ],
+            OPTION_INFO_FIELDS,
             self.option_values,
             columns=4,
         )
@@ -533,7 +1109,8 @@ class AnalysisPage(ttk.Frame):
         self.options_frame.rowconfigure(0, weight=1)
 
         self.option_records: list[dict] = []
-        self.all_option_records: list[dict] = []
+        self.option_chain = OptionChain()
+        self._listed_option_lines: list[str] = []
         list_frame = ttk.Frame(self.options_frame)
         list_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=8)
         list_frame.rowconfigure(0, weight=1)
@@ -542,6 +1119,12 @@ class AnalysisPage(ttk.Frame):
         filter_frame = ttk.Frame(self.options_frame)
         filter_frame.grid(row=0, column=1, sticky="nsew", padx=(0, 10), pady=8)
         filter_frame.columnconfigure(1, weight=1)
+        self._filter_job: str | None = None
+        self._dropdown_values: dict[str, list[str]] = {}
+        self._applied_filters: dict[str, str | None] | None = None
+        self._filter_options_cache: dict[
+            tuple[str | None, str | None, str | None], dict[str, list[str]]
+        ] = {}
 
         ttk.Label(filter_frame, text="Expiration").grid(
             row=0, column=0, padx=5, pady=2, sticky="w"
@@ -585,28 +1168,17 @@ class AnalysisPage(ttk.Frame):
         self.greeks_values: dict[str, ttk.Label] = {}
         self._build_info_grid(
             self.greeks_frame,
-            [
-                ("Delta", "delta"),
-                ("Gamma", "gamma"),
-                ("Theta", "theta"),
-                ("Vega", "vega"),
-                ("Rho", "rho"),
-                ("IV", "iv"),
-            ],
+            GREEK_FIELDS,
             self.greeks_values,
             columns=3,
         )
+        self._panels_mode_is_stock = False
 
         self.strategy_var = tk.StringVar(value=self.controller.state.option_strategy)
         self.strategy_dropdown = ttk.Combobox(
             filter_frame,
             textvariable=self.strategy_var,
-            values=[
-                "Naked Call",
-                "Naked Put",
-                "Vertical Spread",
-                "Calendar Spread",
-            ],
+            values=OPTION_STRATEGIES,
             state="readonly",
             width=20,
         )
@@ -645,7 +1217,7 @@ class AnalysisPage(ttk.Frame):
         self.analysis_mode_dropdown = ttk.Combobox(
             button_row,
             textvariable=self.analysis_mode_var,
-            values=["Stock Analysis", "Option Analysis"],
+            values=ANALYSIS_MODES,
             state="readonly",
             width=20,
         )
@@ -653,21 +1225,21 @@ class AnalysisPage(ttk.Frame):
         self.analysis_mode_dropdown.bind("<<ComboboxSelected>>", self.on_analysis_mode_change)
 
     def _snap_horizon(self, value: str) -> None:
-        snapped = int(round(float(value)))
+        self._pending_horizon = value
+        if self._horizon_job is not None:
+            self.after_cancel(self._horizon_job)
+        self._horizon_job = self.after(HORIZON_SNAP_DELAY_MS, self._apply_horizon)
+
+    def _apply_horizon(self) -> None:
+        self._horizon_job = None
+        snapped = int(round(float(self._pending_horizon)))
         self.horizon_var.set(snapped)
         self.horizon_slider.set(snapped)
 
-    def _effective_market_date(self) -> date:
-        now = datetime.now(ZoneInfo("America/New_York"))
-        market_open = now.replace(hour=9, minute=30, second=0, microsecond=0)
-        if now < market_open:
-            return (now - timedelta(days=1)).date()
-        return now.date()
-
     def _build_info_grid(
         self,
         parent: ttk.Frame,
-        rows: list[tuple[str, str]],
+        rows: tuple[tuple[str, str], ...],
         target: dict[str, ttk.Label],
         columns: int = 1,
     ) -> None:
@@ -686,34 +1258,39 @@ class AnalysisPage(ttk.Frame):
             parent.columnconfigure(index, weight=1)
 
     def _format_float(self, value: float) -> str:
-        decimals = 2 if abs(value) >= 1 else 4
-        multiplier = 10**decimals
-        truncated = math.trunc(value * multiplier) / multiplier
-        return f"{truncated:.{decimals}f}".rstrip("0").rstrip(".")
+        if value.is_integer():
+            return str(int(value))
+        if -1 < value < 1:
+            text = format(math.trunc(value * 10000) / 10000, ".4f")
+        else:
+            text = format(math.trunc(value * 100) / 100, ".2f")
+        return text.rstrip("0").rstrip(".")
 
-    def _set_value(self, label: ttk.Label, value: str | int | float | None) -> None:
+    def _set_value(
+        self, label: ttk.Label, value: str | int | float | None, estimated: bool = False
+    ) -> None:
         if value in (None, "", "--"):
-            label.config(text="--", foreground="#b00020")
+            state = ("--", "#b00020")
         else:
-            if isinstance(value, float):
-                text = self._format_float(value)
-            elif isinstance(value, int):
-                text = str(value)
-            else:
-                text = str(value)
-            label.config(text=text, foreground="#0a7a2f")
+            text = self._format_float(value) if type(value) is float else str(value)
+            state = (f"~{text}", "#8a6d00") if estimated else (text, "#0a7a2f")
+        if self._label_states.get(label) == state:
+            return
+        self._label_states[label] = state
+        label.config(text=state[0], foreground=state[1])
 
-    def _render_chart(self, aggregates: list[dict]) -> None:
+    def _render_chart(self, series: dict[str, list]) -> None:
+        closes = series.get("c", [])
+        timestamps = series.get("t", [])
+        self.chart_canvas.update_idletasks()
+        width = max(self.chart_canvas.winfo_width(), 1)
+        height = max(self.chart_canvas.winfo_height(), 1)
+        chart_key = (width, height, closes, timestamps)
+        if chart_key == self._chart_key:
+            return
+        self._chart_key = chart_key
         self.chart_canvas.delete("all")
-        points_raw: list[tuple[float, int]] = []
-        for item in aggregates:
-            try:
-                close_value = float(item.get("c"))
-                timestamp = int(item.get("t"))
-            except (TypeError, ValueError):
-                continue
-            points_raw.append((close_value, timestamp))
-        if not points_raw:
+        if not closes:
             self.chart_canvas.create_text(
                 220,
                 110,
@@ -721,10 +1298,7 @@ class AnalysisPage(ttk.Frame):
                 fill="#666",
             )
             return
-        if len(points_raw) < 2:
-            self.chart_canvas.update_idletasks()
-            width = max(self.chart_canvas.winfo_width(), 1)
-            height = max(self.chart_canvas.winfo_height(), 1)
+        if len(closes) < 2:
             padding = 20
             x = width / 2
             y = height / 2
@@ -740,42 +1314,30 @@ class AnalysisPage(ttk.Frame):
                 padding,
                 padding / 2,
                 anchor="w",
-                text=f"{points_raw[0][0]:.2f}",
+                text=f"{closes[0]:.2f}",
                 fill="#1f77b4",
             )
             return
-        self.chart_canvas.update_idletasks()
-        width = max(self.chart_canvas.winfo_width(), 1)
-        height = max(self.chart_canvas.winfo_height(), 1)
         padding_left = 60
         padding_right = 20
         padding_top = 20
         padding_bottom = 30
-        min_price = min(price for price, _ts in points_raw)
-        max_price = max(price for price, _ts in points_raw)
+        total_points = len(closes)
+        min_price = min(closes)
+        max_price = max(closes)
         price_span = max(max_price - min_price, 1e-6)
-        x_span = max(len(points_raw) - 1, 1)
-
-        points = []
-        for idx, (price, _ts) in enumerate(points_raw):
-            x = padding_left + (width - padding_left - padding_right) * (idx / x_span)
-            y = height - padding_bottom - (
-                height - padding_top - padding_bottom
-            ) * ((price - min_price) / price_span)
-            points.extend([x, y])
-
-        if len(points) < 4:
-            self.chart_canvas.create_text(
-                220,
-                110,
-                text="Not enough chart data to render a line.",
-                fill="#666",
-            )
-            return
+        x_scale = (width - padding_left - padding_right) / max(total_points - 1, 1)
+        points = _map_chart_points(
+            closes,
+            padding_left,
+            padding_top,
+            width - padding_right,
+            height - padding_bottom,
+            min_price,
+            price_span,
+        )
 
         try:
-            if len(points) < 4:
-                raise tk.TclError("Insufficient points for line rendering.")
             self.chart_canvas.create_line(*points, fill="#1f77b4", width=2, smooth=True)
         except tk.TclError:
             self.chart_canvas.create_text(
@@ -787,13 +1349,14 @@ class AnalysisPage(ttk.Frame):
             return
         grid_color = "#d9d9d9"
         axis_color = "#444"
+        grid_coords: list[float] = []
         for step in range(5):
             fraction = step / 4
             y = height - padding_bottom - (
                 height - padding_top - padding_bottom
             ) * fraction
-            self.chart_canvas.create_line(
-                padding_left, y, width - padding_right, y, fill=grid_color
+            grid_coords.extend(
+                (padding_left, y, width - padding_right, y, padding_left, y)
             )
             value = min_price + (price_span * fraction)
             self.chart_canvas.create_text(
@@ -804,10 +1367,10 @@ class AnalysisPage(ttk.Frame):
                 fill=axis_color,
             )
 
-        self.chart_canvas.create_line(
-            padding_left, padding_top, padding_left, height - padding_bottom, fill=axis_color
-        )
+        self.chart_canvas.create_line(*grid_coords, fill=grid_color)
         self.chart_canvas.create_line(
+            padding_left,
+            padding_top,
             padding_left,
             height - padding_bottom,
             width - padding_right,
@@ -815,13 +1378,11 @@ class AnalysisPage(ttk.Frame):
             fill=axis_color,
         )
 
-        total_points = len(points_raw)
         tick_count = min(5, total_points)
         for tick_index in range(tick_count):
             idx = int(round(tick_index * (total_points - 1) / max(tick_count - 1, 1)))
-            _price, ts = points_raw[idx]
-            x = padding_left + (width - padding_left - padding_right) * (idx / x_span)
-            dt = datetime.fromtimestamp(ts / 1000)
+            x = padding_left + x_scale * idx
+            dt = datetime.fromtimestamp(timestamps[idx] / 1000)
             label = dt.strftime("%m/%d")
             self.chart_canvas.create_text(
                 x,
@@ -832,17 +1393,7 @@ class AnalysisPage(ttk.Frame):
             )
 
     def _strip_html(self, text: str) -> str:
-        class _HTMLStripper(HTMLParser):
-            def __init__(self) -> None:
-                super().__init__()
-                self.parts: list[str] = []
-
-            def handle_data(self, data: str) -> None:
-                self.parts.append(data)
-
-        stripper = _HTMLStripper()
-        stripper.feed(text)
-        return " ".join(stripper.parts)
+        return " ".join(html.unescape(HTML_TAG_RE.sub(" ", text)).split())
 
     def _format_http_error_detail(self, exc: HTTPError) -> str:
         try:
@@ -874,10 +1425,21 @@ class AnalysisPage(ttk.Frame):
         )
 
     def _show_error_dialog(self, title: str, message: str) -> None:
-        dialog = tk.Toplevel(self)
+        if self._error_dialog is None:
+            self._error_dialog = self._build_error_dialog()
+        dialog, text_widget = self._error_dialog
         dialog.title(title)
+        text_widget.delete("1.0", tk.END)
+        text_widget.insert("1.0", message)
+        dialog.deiconify()
+        dialog.lift()
+        text_widget.focus_set()
+
+    def _build_error_dialog(self) -> tuple[tk.Toplevel, tk.Text]:
+        dialog = tk.Toplevel(self)
         dialog.geometry("620x320")
         dialog.transient(self)
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
 
         dialog.rowconfigure(0, weight=1)
         dialog.columnconfigure(0, weight=1)
@@ -892,8 +1454,6 @@ class AnalysisPage(ttk.Frame):
         text_widget.configure(yscrollcommand=scrollbar.set)
         text_widget.grid(row=0, column=0, sticky="nsew")
         scrollbar.grid(row=0, column=1, sticky="ns")
-        text_widget.insert("1.0", message)
-        text_widget.focus_set()
 
         button_frame = ttk.Frame(dialog)
         button_frame.grid(row=1, column=0, pady=(0, 10))
@@ -906,9 +1466,10 @@ class AnalysisPage(ttk.Frame):
         ttk.Button(button_frame, text="Copy", command=copy_to_clipboard).grid(
             row=0, column=0, padx=5
         )
-        ttk.Button(button_frame, text="Close", command=dialog.destroy).grid(
+        ttk.Button(button_frame, text="Close", command=dialog.withdraw).grid(
             row=0, column=1, padx=5
         )
+        return dialog, text_widget
 
     def _on_content_configure(self, _event: tk.Event) -> None:
         self.scroll_canvas.configure(scrollregion=self.scroll_canvas.bbox("all"))
@@ -922,7 +1483,7 @@ class AnalysisPage(ttk.Frame):
             self.scroll_canvas.configure(scrollregion=self.scroll_canvas.bbox("all"))
 
     def _sync_option_snapshot(self) -> None:
-        contract = self.option_contract or {}
+        contract = self.option_contract or EMPTY_MAPPING
         self._set_value(self.option_values["contract"], contract.get("ticker"))
         self._set_value(self.option_values["expiration"], contract.get("expiration_date"))
         contract_type = contract.get("contract_type")
@@ -932,78 +1493,59 @@ class AnalysisPage(ttk.Frame):
 
     def _toggle_info_panels(self) -> None:
         is_stock = self.analysis_mode_var.get() == "Stock Analysis"
-
-        if not self.stock_info_frame.winfo_ismapped():
-            self.stock_info_frame.pack(padx=20, pady=(5, 15), fill="x")
+        if is_stock == self._panels_mode_is_stock:
+            return
+        self._panels_mode_is_stock = is_stock
 
         if is_stock:
             self.option_info_frame.pack_forget()
             self.options_frame.pack_forget()
             self.greeks_frame.pack_forget()
         else:
-            if not self.option_info_frame.winfo_ismapped():
-                self.option_info_frame.pack(padx=20, pady=(5, 15), fill="x")
-            if not self.options_frame.winfo_ismapped():
-                self.options_frame.pack(padx=20, pady=(5, 15), fill="x")
-            if not self.greeks_frame.winfo_ismapped():
-                self.greeks_frame.pack(padx=20, pady=(5, 15), fill="x")
+            self.option_info_frame.pack(padx=20, pady=(5, 15), fill="x")
+            self.options_frame.pack(padx=20, pady=(5, 15), fill="x")
+            self.greeks_frame.pack(padx=20, pady=(5, 15), fill="x")
         self.scroll_canvas.configure(scrollregion=self.scroll_canvas.bbox("all"))
 
-    def _normalize_contract_type(self, value: str | None) -> str | None:
-        if not value:
-            return None
-        return str(value).strip().upper()
-
-    def _format_strike(self, value: float | int | str | None) -> str | None:
-        if value is None:
-            return None
-        try:
-            numeric = float(value)
-        except (TypeError, ValueError):
-            return str(value)
-        if numeric.is_integer():
-            return str(int(numeric))
-        return f"{numeric:.2f}".rstrip("0").rstrip(".")
-
     def _get_filter_value(self, var: tk.StringVar) -> str | None:
         value = var.get()
         return None if value == "All" else value
 
-    def _record_matches_filters(self, record: dict, filters: dict[str, str | None]) -> bool:
-        expiration = record.get("expiration_date")
-        strike = self._format_strike(record.get("strike_price"))
-        contract_type = self._normalize_contract_type(record.get("contract_type"))
-        if filters.get("expiration") and filters["expiration"] != expiration:
-            return False
-        if filters.get("strike") and filters["strike"] != strike:
-            return False
-        if filters.get("type") and filters["type"] != contract_type:
-            return False
-        return True
-
     def _compute_filter_options(
-        self, records: list[dict], current: dict[str, str | None]
+        self, chain: OptionChain, current: dict[str, str | None]
     ) -> dict[str, list[str]]:
-        options: dict[str, set[str]] = {"expiration": set(), "strike": set(), "type": set()}
-        for record in records:
-            expiration = record.get("expiration_date")
-            strike = self._format_strike(record.get("strike_price"))
-            contract_type = self._normalize_contract_type(record.get("contract_type"))
-            if self._record_matches_filters(record, {**current, "expiration": None}):
-                if expiration:
-                    options["expiration"].add(expiration)
-            if self._record_matches_filters(record, {**current, "strike": None}):
-                if strike:
-                    options["strike"].add(strike)
-            if self._record_matches_filters(record, {**current, "type": None}):
-                if contract_type:
-                    options["type"].add(contract_type)
+        current_expiration = current.get("expiration")
+        current_strike = current.get("strike")
+        current_type = current.get("type")
         return {
-            "expiration": sorted(options["expiration"]),
+            "expiration": sorted(
+                chain.values_matching(
+                    chain.expirations,
+                    chain.rows_by_expiration,
+                    None,
+                    current_strike,
+                    current_type,
+                )
+            ),
             "strike": sorted(
-                options["strike"], key=lambda value: float(value) if value.replace(".", "", 1).isdigit() else value
+                chain.values_matching(
+                    chain.strikes,
+                    chain.rows_by_strike,
+                    current_expiration,
+                    None,
+                    current_type,
+                ),
+                key=chain.strike_order.__getitem__,
+            ),
+            "type": sorted(
+                chain.values_matching(
+                    chain.types,
+                    chain.rows_by_type,
+                    current_expiration,
+                    current_strike,
+                    None,
+                )
             ),
-            "type": sorted(options["type"]),
         }
 
     def _refresh_option_filters(self, reset: bool = False) -> None:
@@ -1011,61 +1553,85 @@ class AnalysisPage(ttk.Frame):
             self.expiration_var.set("All")
             self.strike_var.set("All")
             self.type_var.set("All")
-        filters = {
-            "expiration": self._get_filter_value(self.expiration_var),
-            "strike": self._get_filter_value(self.strike_var),
-            "type": self._get_filter_value(self.type_var),
-        }
-        options = self._compute_filter_options(self.all_option_records, filters)
+        filters = self._current_filters()
+        if not reset and filters == self._applied_filters:
+            return
+        cache_key = (filters["expiration"], filters["strike"], filters["type"])
+        options = self._filter_options_cache.get(cache_key)
+        if options is None:
+            if len(self._filter_options_cache) >= FILTER_OPTIONS_CACHE_SIZE:
+                self._filter_options_cache.clear()
+            options = self._compute_filter_options(self.option_chain, filters)
+            self._filter_options_cache[cache_key] = options
         for key, dropdown, var in (
             ("expiration", self.expiration_dropdown, self.expiration_var),
             ("strike", self.strike_dropdown, self.strike_var),
             ("type", self.type_dropdown, self.type_var),
         ):
             values = ["All"] + options[key]
-            dropdown["values"] = values
-            if var.get() not in values:
+            if self._dropdown_values.get(key) != values:
+                dropdown["values"] = values
+                self._dropdown_values[key] = values
+            if filters[key] is not None and filters[key] not in values:
                 var.set("All")
-        self._apply_option_filters()
+                filters[key] = None
+        self._apply_option_filters(filters)
 
-    def _apply_option_filters(self) -> None:
-        filters = {
+    def _current_filters(self) -> dict[str, str | None]:
+        return {
             "expiration": self._get_filter_value(self.expiration_var),
             "strike": self._get_filter_value(self.strike_var),
             "type": self._get_filter_value(self.type_var),
         }
-        self.option_records = [
-            record
-            for record in self.all_option_records
-            if self._record_matches_filters(record, filters)
-        ]
-        self.options_list.delete(0, tk.END)
+
+    def _apply_option_filters(self, filters: dict[str, str | None] | None = None) -> None:
+        if filters is None:
+            filters = self._current_filters()
+        self._applied_filters = filters
+        chain = self.option_chain
+        rows = chain.matching_rows(filters["expiration"], filters["strike"], filters["type"])
+        self.option_records = [chain.records[row] for row in rows]
+        if self.option_records:
+            lines = [chain.labels[row] for row in rows]
+        else:
+            lines = ["No option contracts returned."]
+        self._update_option_lines(lines)
+        self.options_list.selection_clear(0, tk.END)
         if not self.option_records:
-            self.options_list.insert(tk.END, "No option contracts returned.")
             self.option_contract = None
         else:
-            for contract in self.option_records:
-                self.options_list.insert(
-                    tk.END,
-                    "{ticker} {expiration} {type} {strike}".format(
-                        ticker=contract.get("ticker", "--"),
-                        expiration=contract.get("expiration_date", "--"),
-                        type=str(contract.get("contract_type", "--")).upper(),
-                        strike=contract.get("strike_price", "--"),
-                    ),
-                )
             self.options_list.selection_set(0)
             self.options_list.see(0)
             self.option_contract = self.option_records[0]
         self._sync_option_snapshot()
         self._sync_greeks()
 
+    def _update_option_lines(self, lines: list[str]) -> None:
+        listed = self._listed_option_lines
+        if lines == listed:
+            return
+        limit = min(len(listed), len(lines))
+        start = 0
+        while start < limit and listed[start] == lines[start]:
+            start += 1
+        end = 0
+        while end < limit - start and listed[-1 - end] == lines[-1 - end]:
+            end += 1
+        if start < len(listed) - end:
+            self.options_list.delete(start, len(listed) - end - 1)
+        if start < len(lines) - end:
+            self.options_list.insert(start, *lines[start : len(lines) - end])
+        self._listed_option_lines = lines
+
     def refresh(self) -> None:
         self.controller.state.analysis_mode = "Option Analysis"
         self.analysis_mode_var.set("Option Analysis")
         self.strategy_var.set(self.controller.state.option_strategy)
         api_key = load_api_key()
-        self.api_client = MassiveApiClient(api_key) if api_key else None
+        if not api_key:
+            self.api_client = None
+        elif self.api_client is None or self.api_client.api_key != api_key:
+            self.api_client = MassiveApiClient(api_key)
         self._toggle_info_panels()
         self.scroll_canvas.configure(scrollregion=self.scroll_canvas.bbox("all"))
         self.after(0, self.load_market_data)
@@ -1090,90 +1656,147 @@ class AnalysisPage(ttk.Frame):
         if not ticker:
             messagebox.showinfo("Missing ticker", "Select a ticker first.")
             return
-        horizon_index = int(round(self.horizon_var.get()))
+        horizon_index = self.horizon_var.get()
         horizon_index = min(max(horizon_index, 0), len(HORIZON_CONFIGS) - 1)
-        _label, days_back, minutes_per_bar, _cadence_label = HORIZON_CONFIGS[horizon_index]
         cache_payload = load_cached_market_data(ticker) or {}
         cache_date = cache_payload.get("last_updated")
-        today_label = self._effective_market_date().isoformat()
+        today_label = effective_market_date().isoformat()
         aggregates_map = cache_payload.get("aggregates", {})
         cached_stock = cache_payload.get("stock")
         cached_options = cache_payload.get("options")
         cached_aggregates = aggregates_map.get(str(horizon_index))
-        should_fetch = cache_date != today_label
+        _label, _days_back, minutes_per_bar, _cadence_label = HORIZON_CONFIGS[horizon_index]
+        fetched_at = cache_payload.get("fetched_at", {}).get(str(horizon_index), 0)
+        should_fetch = (
+            cache_date != today_label or time.time() - fetched_at >= minutes_per_bar * 60
+        )
         if cached_stock is None or cached_options is None or cached_aggregates is None:
             should_fetch = True
 
-        if should_fetch:
-            try:
-                stock_data = self.api_client.fetch_previous_close(ticker)
-            except HTTPError as exc:
-                self._show_api_error(exc, "Massive", "Verify your Massive API key.")
-                return
-            except URLError as exc:
-                self._show_error_dialog(
-                    "Connection Error",
-                    f"Could not reach Massive API endpoint: {exc.reason}",
-                )
-                return
-            try:
-                option_data = self.api_client.fetch_option_snapshots(ticker)
-            except HTTPError as exc:
-                self._show_api_error(
-                    exc,
-                    "Massive",
+        self._load_generation += 1
+        if not should_fetch:
+            self._apply_market_data(
+                cached_stock or {},
+                self._normalize_option_records(cached_options or []),
+                aggregate_series(cached_aggregates or []),
+            )
+            return
+
+        generation = self._load_generation
+        fetch_key = (self.api_client.api_key, ticker, horizon_index)
+        future = self._pending_fetches.get(fetch_key)
+        if future is None:
+            future = self.controller.executor.submit(
+                self._fetch_market_data,
+                self.api_client,
+                ticker,
+                horizon_index,
+                today_label,
+            )
+            self._pending_fetches[fetch_key] = future
+            future.add_done_callback(
+                lambda _done: self._post_to_ui(self._pending_fetches.pop, fetch_key, None)
+            )
+        future.add_done_callback(
+            lambda done: self._post_to_ui(self._on_market_data_fetched, done, generation)
+        )
+
+    def _fetch_market_data(
+        self,
+        client: MassiveApiClient,
+        ticker: str,
+        horizon_index: int,
+        today_label: str,
+    ) -> tuple[dict, list[dict], dict[str, list]]:
+        _label, days_back, minutes_per_bar, _cadence_label = HORIZON_CONFIGS[horizon_index]
+        with ThreadPoolExecutor(max_workers=3) as fetch_pool:
+            futures = (
+                fetch_pool.submit(
+                    _fetch_with_hint,
+                    "Verify your Massive API key.",
+                    client.fetch_previous_close,
+                    ticker,
+                ),
+                fetch_pool.submit(
+                    _fetch_with_hint,
                     "Verify your Massive API key and options data entitlements.",
-                )
-                return
-            except URLError as exc:
-                self._show_error_dialog(
-                    "Connection Error",
-                    f"Could not reach Massive API endpoint: {exc.reason}",
-                )
-                return
-            try:
-                aggregates = self.api_client.fetch_aggregates(
-                    ticker, days_back, minutes_per_bar
-                )
-            except HTTPError as exc:
-                self._show_api_error(exc, "Massive", "Verify your Massive API key.")
-                return
-            except URLError as exc:
+                    client.fetch_option_snapshots,
+                    ticker,
+                ),
+                fetch_pool.submit(
+                    _fetch_with_hint,
+                    "Verify your Massive API key.",
+                    client.fetch_aggregates,
+                    ticker,
+                    days_back,
+                    minutes_per_bar,
+                ),
+            )
+        stock_data, option_data, raw_aggregates = (future.result() for future in futures)
+        aggregates = aggregate_series(raw_aggregates)
+        option_records = self._normalize_option_records(option_data)
+        horizon_key = str(horizon_index)
+
+        def merge(current: dict) -> dict:
+            return {
+                **current,
+                "last_updated": today_label,
+                "fetched_at": {**current.get("fetched_at", {}), horizon_key: time.time()},
+                "stock": stock_data,
+                "options": option_records,
+                "aggregates": {**current.get("aggregates", {}), horizon_key: aggregates},
+            }
+
+        try:
+            update_cached_market_data(ticker, merge)
+        except OSError:
+            pass
+        return stock_data, option_records, aggregates
+
+    def _post_to_ui(self, callback: Callable[..., None], *args: object) -> None:
+        try:
+            self.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _on_market_data_fetched(self, future: Future, generation: int) -> None:
+        if generation != self._load_generation:
+            return
+        try:
+            stock_data, option_records, aggregates = future.result()
+        except MarketDataError as exc:
+            if isinstance(exc.error, HTTPError):
+                self._show_api_error(exc.error, "Massive", exc.hint)
+            else:
                 self._show_error_dialog(
                     "Connection Error",
-                    f"Could not reach Massive API endpoint: {exc.reason}",
+                    f"Could not reach Massive API endpoint: {exc.error.reason}",
                 )
-                return
-            aggregates_map[str(horizon_index)] = aggregates
-            option_records = self._normalize_option_records(option_data)
-            cache_payload.update(
-                {
-                    "last_updated": today_label,
-                    "stock": stock_data,
-                    "options": option_records,
-                    "aggregates": aggregates_map,
-                }
+            return
+        except Exception as exc:
+            self._show_error_dialog(
+                "Connection Error", f"Could not load market data: {exc}"
             )
-            save_cached_market_data(ticker, cache_payload)
-        else:
-            stock_data = cached_stock or {}
-            option_records = self._normalize_option_records(cached_options or [])
-            aggregates = cached_aggregates or []
-
-        self._set_value(self.stock_values["price"], stock_data.get("close"))
-        self._set_value(self.stock_values["prev_close"], stock_data.get("close"))
-        self._set_value(self.stock_values["open"], stock_data.get("open"))
-        self._set_value(self.stock_values["high"], stock_data.get("high"))
-        self._set_value(self.stock_values["low"], stock_data.get("low"))
-        self._set_value(self.stock_values["volume"], stock_data.get("volume"))
-        self._set_value(self.stock_values["market_cap"], "--")
-        self._set_value(self.stock_values["range_52w"], "--")
+            return
+        self._apply_market_data(stock_data, option_records, aggregates)
+
+    def _apply_market_data(
+        self, stock_data: dict, option_records: list[dict], aggregates: dict[str, list]
+    ) -> None:
+        self.estimated_greeks = estimate_missing_greeks(
+            option_records, stock_data.get("close"), effective_market_date()
+        )
+        stock_values = self.stock_values
+        get = stock_data.get
+        for key, source in STOCK_VALUE_SOURCES:
+            self._set_value(stock_values[key], "--" if source is None else get(source))
         self.option_contract = option_records[0] if option_records else None
         self._sync_option_snapshot()
 
         self._render_chart(aggregates)
 
-        self.all_option_records = option_records
+        self.option_chain = OptionChain.from_records(option_records)
+        self._filter_options_cache.clear()
         self._refresh_option_filters(reset=True)
 
     def save_analysis(self) -> None:
@@ -1190,69 +1813,90 @@ class AnalysisPage(ttk.Frame):
         index = selection[0]
         if index >= len(self.option_records):
             return
-        self.option_contract = self.option_records[index]
+        contract = self.option_records[index]
+        if contract is self.option_contract:
+            return
+        self.option_contract = contract
         self._sync_option_snapshot()
         self._sync_greeks()
 
     def on_option_filter_change(self, _event: object) -> None:
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(FILTER_DELAY_MS, self._apply_filter_change)
+
+    def _apply_filter_change(self) -> None:
+        self._filter_job = None
         self._refresh_option_filters()
 
     def _sync_greeks(self) -> None:
-        greeks = self._extract_greeks(self.option_contract or {})
-        self._set_value(self.greeks_values["delta"], greeks.get("delta"))
-        self._set_value(self.greeks_values["gamma"], greeks.get("gamma"))
-        self._set_value(self.greeks_values["theta"], greeks.get("theta"))
-        self._set_value(self.greeks_values["vega"], greeks.get("vega"))
-        self._set_value(self.greeks_values["rho"], greeks.get("rho"))
+        contract = self.option_contract or EMPTY_MAPPING
+        greeks = self._extract_greeks(contract)
+        estimates = self.estimated_greeks.get(contract.get("ticker")) or EMPTY_MAPPING
+        for name in BLACK_SCHOLES_GREEKS:
+            value = greeks.get(name)
+            if value is None and estimates.get(name) is not None:
+                self._set_value(self.greeks_values[name], estimates[name], estimated=True)
+            else:
+                self._set_value(self.greeks_values[name], value)
         self._set_value(self.greeks_values["iv"], greeks.get("iv"))
 
     def _normalize_option_records(self, records: list[dict]) -> list[dict]:
         normalized: list[dict] = []
+        append = normalized.append
         for record in records:
             if not isinstance(record, dict):
                 continue
-            details = record.get("details") or {}
-            greeks = record.get("greeks") or {}
-            day = record.get("day") or {}
-            last_trade = record.get("last_trade") or {}
-            last_quote = record.get("last_quote") or {}
+            get = record.get
+            details = (get("details") or EMPTY_MAPPING).get
+            greeks = get("greeks") or {}
+            day = (get("day") or EMPTY_MAPPING).get
+            last_trade = (get("last_trade") or EMPTY_MAPPING).get
+            last_quote = (get("last_quote") or EMPTY_MAPPING).get
             if not isinstance(greeks, dict):
-                greeks = {}
-            implied_vol = greeks.get("iv")
-            if implied_vol is None:
-                implied_vol = record.get("implied_volatility") or record.get("implied_vol")
-            volume = record.get("volume")
-            if volume is None:
-                volume = day.get("volume") or day.get("v")
-            open_interest = record.get("open_interest") or details.get("open_interest")
-            normalized.append(
+                greeks = EMPTY_MAPPING
+            greek = greeks.get
+            implied_vol = _first_non_none(
+                greek("iv"), get("implied_volatility"), get("implied_vol")
+            )
+            append(
                 {
-                    "ticker": record.get("ticker") or details.get("ticker"),
-                    "expiration_date": record.get("expiration_date")
-                    or details.get("expiration_date"),
-                    "contract_type": record.get("contract_type")
-                    or details.get("contract_type"),
-                    "strike_price": record.get("strike_price") or details.get("strike_price"),
+                    "ticker": _first_non_none(get("ticker"), details("ticker")),
+                    "expiration_date": _first_non_none(
+                        get("expiration_date"), details("expiration_date")
+                    ),
+                    "contract_type": _first_non_none(
+                        get("contract_type"), details("contract_type")
+                    ),
+                    "strike_price": _first_non_none(
+                        get("strike_price"), details("strike_price")
+                    ),
                     "implied_volatility": implied_vol,
-                    "volume": volume,
-                    "open_interest": open_interest,
-                    "bid": record.get("bid")
-                    or last_quote.get("bid")
-                    or last_quote.get("bid_price")
-                    or last_quote.get("bp"),
-                    "ask": record.get("ask")
-                    or last_quote.get("ask")
-                    or last_quote.get("ask_price")
-                    or last_quote.get("ap"),
-                    "last": record.get("last")
-                    or last_trade.get("price")
-                    or last_trade.get("p"),
+                    "volume": _first_non_none(get("volume"), day("volume"), day("v")),
+                    "open_interest": _first_non_none(
+                        get("open_interest"), details("open_interest")
+                    ),
+                    "bid": _first_non_none(
+                        get("bid"),
+                        last_quote("bid"),
+                        last_quote("bid_price"),
+                        last_quote("bp"),
+                    ),
+                    "ask": _first_non_none(
+                        get("ask"),
+                        last_quote("ask"),
+                        last_quote("ask_price"),
+                        last_quote("ap"),
+                    ),
+                    "last": _first_non_none(
+                        get("last"), last_trade("price"), last_trade("p")
+                    ),
                     "greeks": {
-                        "delta": greeks.get("delta"),
-                        "gamma": greeks.get("gamma"),
-                        "theta": greeks.get("theta"),
-                        "vega": greeks.get("vega"),
-                        "rho": greeks.get("rho"),
+                        "delta": greek("delta"),
+                        "gamma": greek("gamma"),
+                        "theta": greek("theta"),
+                        "vega": greek("vega"),
+                        "rho": greek("rho"),
                         "iv": implied_vol,
                     },
                 }
@@ -1260,9 +1904,9 @@ class AnalysisPage(ttk.Frame):
         return normalized
 
     def _extract_greeks(self, contract: dict) -> dict:
-        greeks = contract.get("greeks") or {}
+        greeks = contract.get("greeks") or EMPTY_MAPPING
         if not isinstance(greeks, dict):
-            greeks = {}
+            greeks = EMPTY_MAPPING
         implied_vol = greeks.get("iv")
         if implied_vol is None:
             implied_vol = contract.get("implied_volatility") or contract.get("implied_vol")